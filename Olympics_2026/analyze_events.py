@@ -17,25 +17,37 @@ print("Fetching all events...")
 response = api.get_all_events(limit=500)
 df = OlympicsDataProcessor.parse_events_response(response)
 
-print(f"\n📊 Total events after deduplication: {len(df)}")
+total = len(df)
+print(f"\n📊 Total events after deduplication: {total}")
+
+
+def format_counts(counts: pd.Series, labels: pd.Series, show_percentage: bool = True) -> str:
+    """Format value counts as indented report lines in one vectorized pass"""
+    lines = "  " + labels.to_numpy() + ": " + counts.astype(str).to_numpy() + " events"
+    if show_percentage:
+        percentages = (counts / total * 100).map("{:.1f}".format)
+        lines = lines + " (" + percentages.to_numpy() + "%)"
+    return "\n".join(lines)
+
+
+def sport_labels(sport_counts: pd.Series) -> pd.Series:
+    """Label sport codes as 'Sport Name (code)'"""
+    codes = pd.Series(sport_counts.index.astype(str))
+    return OlympicsDataProcessor.map_sport_names(codes) + " (" + codes + ")"
+
 
 # Analyze by sport
 print("\n🏅 Events by Sport:")
 sport_counts = df['sport_code'].value_counts()
-for sport_code, count in sport_counts.items():
-    sport_name = OlympicsDataProcessor.get_sport_name(sport_code)
-    percentage = (count / len(df)) * 100
-    print(f"  {sport_name} ({sport_code}): {count} events ({percentage:.1f}%)")
+print(format_counts(sport_counts, sport_labels(sport_counts)))
 
 print("\n📍 Top 10 Venues by Event Count:")
 venue_counts = df['venue_full'].value_counts().head(10)
-for venue, count in venue_counts.items():
-    percentage = (count / len(df)) * 100
-    print(f"  {venue}: {count} events ({percentage:.1f}%)")
+print(format_counts(venue_counts, pd.Series(venue_counts.index.astype(str))))
 
 # Check Freestyle Skiing in detail
 print("\n🔍 Freestyle Skiing Events Detail:")
-frs_df = df[df['sport_code'] == 'frs'].copy()
+frs_df = df[df['sport_code'] == 'frs']
 print(f"Total FRS events: {len(frs_df)}")
 
 # Show unique event names
@@ -46,24 +58,25 @@ for event_name, count in unique_events.items():
 
 # Check if there are multiple sessions/heats for the same event
 print("\n🔍 Livigno Snow Park Events:")
-livigno_df = df[df['venue_full'].str.contains('Livigno', na=False)].copy()
+livigno_venues = [v for v in df['venue_full'].dropna().unique() if 'Livigno' in v]
+livigno_df = df[df['venue_full'].isin(livigno_venues)]
 print(f"Total events at Livigno: {len(livigno_df)}")
 
 print("\nSports at Livigno:")
 livigno_sports = livigno_df['sport_code'].value_counts()
-for sport_code, count in livigno_sports.items():
-    sport_name = OlympicsDataProcessor.get_sport_name(sport_code)
-    print(f"  {sport_name} ({sport_code}): {count} events")
+livigno_sports = livigno_sports[livigno_sports > 0]
+print(format_counts(livigno_sports, sport_labels(livigno_sports), show_percentage=False))
 
 # Check for potential duplicates that weren't caught
 print("\n⚠️ Checking for potential near-duplicates in Freestyle Skiing:")
-frs_grouped = frs_df.groupby(['event_name', 'date']).size().reset_index(name='count')
-duplicates = frs_grouped[frs_grouped['count'] > 1]
+frs_groups = frs_df.groupby(['event_name', 'date'], sort=False, observed=True)
+frs_counts = frs_groups.size()
+duplicates = frs_counts[frs_counts > 1]
 if len(duplicates) > 0:
     print("Found multiple events with same name and date:")
-    for _, row in duplicates.iterrows():
-        print(f"  {row['event_name']} on {row['date']}: {row['count']} events")
-        same_events = frs_df[(frs_df['event_name'] == row['event_name']) & (frs_df['date'] == row['date'])]
-        print(f"    Times: {same_events['time'].tolist()}")
+    time_lists = frs_groups['time'].agg(list)
+    for (event_name, date), count in duplicates.items():
+        print(f"  {event_name} on {date}: {count} events")
+        print(f"    Times: {time_lists[(event_name, date)]}")
 else:
     print("No obvious duplicates found (same name + date)")
@@ -5,13 +5,16 @@ Interactive Streamlit app for viewing all Olympic events and results
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-import pytz
+import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from src.api_client import MilanoCortina2026API
-from src.data_processor import OlympicsDataProcessor
+from src.data_processor import MILAN_TZ, OlympicsDataProcessor
 from src.visualizations import OlympicsVisualizations
 from utils.cache_manager import CacheManager
 from utils.helpers import StreamlitHelpers, ValidationHelpers
@@ -19,6 +22,29 @@ from utils.helpers import StreamlitHelpers, ValidationHelpers
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Games dates shared by the tabs
+OLYMPICS_START = datetime(2026, 2, 6).date()
+OLYMPICS_END = datetime(2026, 2, 22).date()
+
+
+def games_ttl(live_seconds: int, idle_seconds: int) -> int:
+    """Pick a cache TTL: short while the Games are on, long before and after them"""
+    today = datetime.now(MILAN_TZ).date()
+    return live_seconds if OLYMPICS_START <= today <= OLYMPICS_END else idle_seconds
+
+
+# Event cache TTLs, re-evaluated on every script run so they follow the Games calendar
+# API calls: 10 minutes during the Games, 4 hours otherwise. A 60-120 s TTL would be too many calls for the
+# Basic plan (10,000 requests/month): polling every 90 s over the 17 Games days is ~16,300 events calls alone,
+# while 600 s is ~2,450 and leaves room for the sports, countries and today endpoints.
+EVENTS_API_TTL = games_ttl(600, 14400)
+EVENTS_TTL = games_ttl(600, 3600)  # Parsed/derived frames: keeps computed status columns fresh
+
+# Default event table timestamp format (pre-formatted into "date_time" by get_events_df)
+TABLE_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
 # Page configuration
 st.set_page_config(
     page_title="🏅 Milano-Cortina 2026 Olympics",
@@ -27,8 +53,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Static page chrome
+CUSTOM_CSS = """
     <style>
     .main {
         padding: 0rem 0rem;
@@ -48,7 +74,53 @@ st.markdown("""
         margin: 0.25rem;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+HEADER_HTML = """
+    <div style='text-align: center;'>
+        <h1 style='color: #1e3a8a; margin-bottom: 0.3rem;'>🏅 MILANO-CORTINA 2026</h1>
+        <h3 style='color: #374151; margin-bottom: 0.5rem;'>Winter Olympics Live Dashboard</h3>
+        <h4 style='color: #1e3a8a; margin-bottom: 0.5rem;'>🎿 Welcome to the Olympic Experience! ⛷️</h4>
+    </div>
+    <div style='text-align: center; padding: 1rem; background-color: #f0f8ff; border-radius: 10px; margin: 1rem 0;'>
+        <p style='color: #374151; font-size: 1.1rem;'>
+            Join me in following the journey of <strong>90+ nations</strong> competing across <strong>16 winter sports</strong>! 
+            Track and discover exciting events, and celebrate every thrilling moment together. 
+            <strong>Let the Games begin!</strong> 🏆
+        </p>
+    </div>
+    """
+
+LINK_CARD_TEMPLATE = """
+        <div style='border: 2px solid #e5e7eb; border-radius: 10px; padding: 1rem; min-height: 200px; background-color: white; display: flex; flex-direction: column;'>
+            <h4 style='color: #1e3a8a; margin-top: 0;'>{title}</h4>
+            <p style='color: #6b7280; flex-grow: 1;'>{description}</p>
+            <a href='{url}' target='_blank' style='text-decoration: none;'>
+                <div style='background-color: {color}; color: white; padding: 0.75rem; border-radius: 5px; text-align: center; font-weight: bold;'>
+                    {label}
+                </div>
+            </a>
+        </div>
+        """
+
+OLYMPICS_LINK_HTML = LINK_CARD_TEMPLATE.format(
+    title="📰 Official Olympics Website",
+    description="Get official news, schedules, and athlete profiles",
+    url="https://www.olympics.com/en/milano-cortina-2026",
+    color="#3b82f6",
+    label="Visit Olympics.com →"
+)
+
+YOUTUBE_LINK_HTML = LINK_CARD_TEMPLATE.format(
+    title="🎥 Official YouTube Channel",
+    description="Watch highlights, athlete stories, and live coverage",
+    url="https://www.youtube.com/@Olympics/streams",
+    color="#dc2626",
+    label="Watch on YouTube →"
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 @st.cache_resource
@@ -61,7 +133,7 @@ def init_api_client():
     return MilanoCortina2026API(api_key)
 
 
-@st.cache_data(ttl=14400)  # 4 hours - optimized for Basic plan (10k requests/month)
+@st.cache_data(ttl=EVENTS_API_TTL)  # Optimized for Basic plan (10k requests/month)
 def fetch_all_events():
     """Fetch all events from API with caching"""
     api = init_api_client()
@@ -86,6 +158,22 @@ def fetch_all_events():
         return {}
 
 
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_events_df() -> pd.DataFrame:
+    """Fetch and parse all events into a DataFrame (cached, no arguments to hash)"""
+    df = OlympicsDataProcessor.parse_events_response(fetch_all_events())
+    if "datetime" in df.columns:
+        # Format the default table timestamps once per data refresh instead of per table
+        df["date_time"] = OlympicsDataProcessor.format_datetimes(df["datetime"], TABLE_TIME_FORMAT).astype("category")
+    return df
+
+
+@st.cache_resource(ttl=EVENTS_TTL, show_spinner=False)
+def get_events_df_view() -> pd.DataFrame:
+    """Shared events DataFrame for read-only callers (cached as a resource, so no copy per call; don't mutate)"""
+    return get_events_df()
+
+
 @st.cache_data(ttl=14400)  # 4 hours - optimized for Basic plan
 def fetch_today_events():
     """Fetch today's events"""
@@ -168,6 +256,317 @@ def fetch_all_countries():
         return {"success": False, "countries": []}
 
 
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_sport_codes() -> tuple:
+    """Get the sport codes from the sports API response, normalized once (cached)"""
+    sports_response = fetch_all_sports()
+    sports_list = sports_response.get("sports", []) if sports_response.get("success") else []
+    return tuple(sport.get("code") for sport in sports_list if isinstance(sport, dict) and sport.get("code"))
+
+
+@st.cache_resource(ttl=86400, show_spinner=False)
+def get_sport_name_map(sport_codes: tuple) -> dict:
+    """Map sport codes to display names (cached as a shared, read-only dict)"""
+    return {code: OlympicsDataProcessor.get_sport_name(code) for code in sport_codes}
+
+
+@st.cache_resource(ttl=86400, show_spinner=False)
+def get_sport_filter_labels(sport_codes: tuple) -> dict:
+    """Map sport filter options ("All" plus each code) to their labels (cached as a shared, read-only dict)"""
+    labels = {"All": "All Sports"}
+    labels.update((code, name.strip()) for code, name in get_sport_name_map(sport_codes).items())
+    return labels
+
+
+@st.cache_resource(ttl=86400, show_spinner=False)
+def get_sport_codes_by_name(sport_codes: tuple) -> dict:
+    """Map sport display names back to their codes (cached as a shared, read-only dict)"""
+    codes_by_name = {}
+    for code, name in get_sport_name_map(sport_codes).items():
+        codes_by_name.setdefault(name, code)
+    return codes_by_name
+
+
+@st.cache_resource(ttl=EVENTS_TTL, show_spinner=False)
+def get_unique_events_df() -> pd.DataFrame:
+    """All events with same-name/time/venue duplicates removed (shared read-only frame; don't mutate)"""
+    return OlympicsDataProcessor.drop_duplicate_events(get_events_df_view())
+
+
+@st.cache_resource(ttl=EVENTS_TTL, max_entries=32, show_spinner=False)
+def get_country_events_df(country_code: str) -> pd.DataFrame:
+    """Events involving one country (shared read-only frame per country; don't mutate)"""
+    all_df = get_events_df_view()
+    return OlympicsDataProcessor.filter_by_country(all_df, country_code)
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_country_stats(country_code: str) -> dict:
+    """Compute the country tracker metrics together (cached per country)"""
+    country_events = get_country_events_df(country_code)
+    return {
+        "total": len(country_events),
+        # Events that haven't happened yet (status not Completed)
+        "upcoming": int(country_events["status"].ne("Completed").sum()),
+        "sports": country_events["sport_code"].nunique() if "sport_code" in country_events.columns else 0,
+    }
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_country_sport_codes(country_code: str) -> tuple:
+    """Get the sport codes of one country's events (cached per country)"""
+    country_events = get_country_events_df(country_code)
+    if "sport_code" not in country_events.columns:
+        return ()
+    return tuple(str(code) for code in country_events["sport_code"].dropna().unique() if code)
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_country_codes() -> list:
+    """Get sorted country codes, preferring the countries endpoint over walking the event teams (cached)"""
+    response = fetch_all_countries()
+    if response.get("success") and response.get("countries"):
+        codes = {
+            str(country.get("code") or country.get("country_code") or "").upper()
+            for country in response["countries"] if isinstance(country, dict)
+        }
+        codes.discard("")
+        if codes:
+            return sorted(codes)
+    
+    return OlympicsDataProcessor.get_team_country_codes(get_events_df_view())
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_events_stats() -> dict:
+    """Compute the stats card values for all events (cached)"""
+    stats = OlympicsVisualizations.create_stats_cards(get_events_df_view())
+    stats["today_events"] = str(len(get_today_events_df()))
+    return stats
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_today_events_df() -> pd.DataFrame:
+    """Get events starting today (Milan time) from the cached schedule instead of a second API call (cached)"""
+    all_df = get_events_df_view()
+    if all_df.empty:
+        # Fall back to the today endpoint only when the full schedule is unavailable
+        return OlympicsDataProcessor.parse_events_response(fetch_today_events())
+    
+    today = pd.Timestamp(datetime.now(MILAN_TZ).date(), tz=MILAN_TZ)
+    return OlympicsDataProcessor.filter_by_date_range(all_df, today, today)
+
+
+def get_display_source(df: pd.DataFrame) -> pd.DataFrame:
+    """Select the columns an event table is built from (keeps the frame cheap to hash)"""
+    venue_col = "venue_full" if "venue_full" in df.columns else "venue"
+    source_cols = ["event_name", "sport_code", "discipline_detailed", "datetime", "date_time", venue_col, "city", "status"]
+    return df[[col for col in source_cols if col in df.columns]]
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_display_df(
+    events_df: pd.DataFrame,
+    time_label: str = "date_time",
+    time_format: str = TABLE_TIME_FORMAT,
+    include_discipline: bool = False,
+    include_city: bool = False
+) -> pd.DataFrame:
+    """
+    Build the event table shown by st.dataframe (cached on the frame's content)
+
+    Args:
+        events_df: Deduplicated events, as returned by get_display_source
+        time_label: Header for the date/time column
+        time_format: strftime format for the date/time column
+        include_discipline: Add a discipline column after the sport
+        include_city: Add a city column after the venue
+
+    Returns:
+        DataFrame of display strings
+    """
+    # parse_events_response guarantees the display columns, so only the optional ones are checked
+    venue_col = "venue_full" if "venue_full" in events_df.columns else "venue"
+    has_discipline = "discipline_detailed" in events_df.columns
+
+    # Convert every text column in one astype call
+    text_cols = ["event_name", venue_col, "city", "status"] + (["discipline_detailed"] if has_discipline else [])
+    text_df = events_df[text_cols].astype("string").fillna("")
+
+    if "sport_code" in events_df.columns:
+        sport_codes = events_df["sport_code"]
+    else:
+        sport_codes = pd.Series("N/A", index=events_df.index, dtype=object)
+    sports = OlympicsDataProcessor.map_sport_names(sport_codes).to_numpy()
+
+    columns = {"event_name": text_df["event_name"].to_numpy(), "sport": sports}
+    if include_discipline:
+        columns["discipline"] = text_df["discipline_detailed"].to_numpy() if has_discipline else sports
+    if time_format == TABLE_TIME_FORMAT and "date_time" in events_df.columns:
+        columns[time_label] = events_df["date_time"].to_numpy(dtype=object)
+    else:
+        columns[time_label] = OlympicsDataProcessor.format_datetimes(events_df["datetime"], time_format).to_numpy()
+    columns["venue"] = text_df[venue_col].to_numpy()
+    if include_city:
+        columns["city"] = text_df["city"].to_numpy()
+    columns["status"] = text_df["status"].to_numpy()
+
+    return pd.DataFrame(columns)
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_country_display_df(country_code: str, sport_code: str = None) -> pd.DataFrame:
+    """Build a country's event table, optionally for one sport (cached per country and sport)"""
+    events_df = get_country_events_df(country_code)
+    if sport_code:
+        events_df = OlympicsDataProcessor.filter_by_sport(events_df, sport_code)
+    
+    if events_df.empty:
+        return pd.DataFrame()
+    
+    # Remove duplicate events (same name, start time and venue)
+    events_df = OlympicsDataProcessor.drop_duplicate_events(events_df)
+    return build_display_df(get_display_source(events_df))
+
+
+@st.cache_resource(ttl=EVENTS_TTL, max_entries=64, show_spinner=False)
+def get_filtered_events_df(
+    date_from: date = None,
+    date_to: date = None,
+    sport_code: str = None,
+    status: str = None
+) -> pd.DataFrame:
+    """
+    Filter the deduplicated events (shared read-only frame per filter combination; don't mutate)
+
+    Args:
+        date_from: First Games day to include
+        date_to: Last Games day to include
+        sport_code: Sport code to keep, or None for all sports
+        status: Event status to keep, or None for all statuses
+
+    Returns:
+        Filtered events DataFrame
+    """
+    events_df = get_unique_events_df()
+    if events_df.empty:
+        return events_df
+    
+    # AND every condition into one mask and slice once
+    mask = pd.Series(True, index=events_df.index)
+    
+    if date_from and date_to:
+        start_date = pd.Timestamp(date_from, tz=MILAN_TZ)
+        end_date = pd.Timestamp(date_to, tz=MILAN_TZ)
+        mask &= OlympicsDataProcessor.date_range_mask(events_df, start_date, end_date)
+    
+    if sport_code and "sport_code" in events_df.columns:
+        mask &= events_df["sport_code"].eq(sport_code)
+    
+    if status and "status" in events_df.columns:
+        mask &= events_df["status"].eq(status)
+    
+    # Default filters select every event; skip the row copy then
+    return events_df if mask.all() else events_df[mask]
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_filtered_display_df(filters: tuple, **display_options) -> pd.DataFrame:
+    """Build the event table for a get_filtered_events_df filter tuple (cached on the filters, not the frame)"""
+    return build_display_df(get_display_source(get_filtered_events_df(*filters)), **display_options)
+
+
+def get_chart_source(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop the nested teams/venue columns charts don't read (keeps the frame cheap to hash)"""
+    nested_cols = ["teams", "team_codes"] + (["venue"] if "venue_full" in df.columns else [])
+    return df.drop(columns=[col for col in nested_cols if col in df.columns])
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_chart(chart_name: str, events_df: pd.DataFrame, **kwargs) -> go.Figure:
+    """Build an OlympicsVisualizations chart by name (cached on the frame's content)"""
+    return getattr(OlympicsVisualizations, chart_name)(events_df, **kwargs)
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_events_chart(chart_name: str) -> go.Figure:
+    """Build a chart over all events (cached by name, so reruns skip hashing the frame)"""
+    return getattr(OlympicsVisualizations, chart_name)(get_chart_source(get_events_df_view()))
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_country_chart(chart_name: str, country_code: str) -> go.Figure:
+    """Build a chart over one country's events (cached per country)"""
+    return getattr(OlympicsVisualizations, chart_name)(get_chart_source(get_country_events_df(country_code)))
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_medal_sports_chart(sport_counts: pd.DataFrame, country_code: str) -> go.Figure:
+    """Build the medal events by sport bar chart for one country (cached)"""
+    fig = go.Figure(data=[go.Bar(
+        x=sport_counts["sport_name"],
+        y=sport_counts["count"],
+        marker=dict(color="#FFD700"),
+        text=sport_counts["count"],
+        textposition="outside"
+    )])
+    
+    fig.update_layout(
+        title=f"Medal Events by Sport - {country_code}",
+        xaxis_title="Sport",
+        yaxis_title="Number of Events",
+        height=400,
+        showlegend=False,
+        template="plotly_white"
+    )
+    return fig
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def build_participation_chart(top_countries: pd.Series) -> go.Figure:
+    """Build the top countries by event participation bar chart (cached)"""
+    fig = go.Figure(data=[go.Bar(
+        x=top_countries.index,
+        y=top_countries.to_numpy(),
+        marker=dict(
+            color=top_countries.to_numpy(),
+            colorscale=[[0, "#CD7F32"], [0.5, "#C0C0C0"], [1, "#FFD700"]],
+            showscale=False
+        ),
+        text=top_countries.to_numpy(),
+        textposition="outside"
+    )])
+    
+    fig.update_layout(
+        title="Top 10 Countries by Event Participation",
+        xaxis_title="Country",
+        yaxis_title="Number of Events",
+        height=500,
+        template="plotly_white"
+    )
+    return fig
+
+
+@st.cache_data(ttl=EVENTS_TTL, show_spinner=False)
+def get_csv_bytes(filters: tuple, **display_options) -> bytes:
+    """Encode a filtered event table as CSV for the download button (cached on the filters, not the frame)"""
+    return build_filtered_display_df(filters, **display_options).to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def load_presentation() -> bytes:
+    """Read the PowerPoint file once (cached); returns None if it cannot be read"""
+    ppt_path = os.path.join(os.path.dirname(__file__), "src", "MWN Olympic Games downhill skiing presentation 2126.pptx")
+    if not os.path.exists(ppt_path):
+        ppt_path = "src/MWN Olympic Games downhill skiing presentation 2126.pptx"
+    
+    try:
+        with open(ppt_path, "rb") as file:
+            return file.read()
+    except OSError:
+        return None
+
+
 @st.cache_data(ttl=14400)  # 4 hours - optimized for Basic plan
 def fetch_country_events(country_code: str):
     """Fetch events for a specific country"""
@@ -193,72 +592,57 @@ def fetch_country_events(country_code: str):
         return {}
 
 
+def prefetch_api_data():
+    """Warm the events and sports caches concurrently (once per session)"""
+    if st.session_state.get("api_prefetched"):
+        return
+    
+    # Worker threads need the script context to use st.* calls and session state
+    ctx = get_script_run_ctx()
+    fetchers = (fetch_all_events, fetch_all_sports)
+    with ThreadPoolExecutor(
+        max_workers=len(fetchers),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as executor:
+        futures = {executor.submit(fetcher): fetcher.__name__ for fetcher in fetchers}
+        for future in as_completed(futures):
+            # A failed prefetch must not block the others; the tab's own fetch retries it
+            try:
+                future.result()
+            except Exception:
+                logger.warning("Prefetch %s failed", futures[future], exc_info=True)
+    
+    st.session_state["api_prefetched"] = True
+
+
 def render_header():
     """Render page header"""
-    # Center-aligned header
-    st.markdown("""
-    <div style='text-align: center;'>
-        <h1 style='color: #1e3a8a; margin-bottom: 0.3rem;'>🏅 MILANO-CORTINA 2026</h1>
-        <h3 style='color: #374151; margin-bottom: 0.5rem;'>Winter Olympics Live Dashboard</h3>
-        <h4 style='color: #1e3a8a; margin-bottom: 0.5rem;'>🎿 Welcome to the Olympic Experience! ⛷️</h4>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Friendly invitation
-    st.markdown("""
-    <div style='text-align: center; padding: 1rem; background-color: #f0f8ff; border-radius: 10px; margin: 1rem 0;'>
-        <p style='color: #374151; font-size: 1.1rem;'>
-            Join me in following the journey of <strong>90+ nations</strong> competing across <strong>16 winter sports</strong>! 
-            Track and discover exciting events, and celebrate every thrilling moment together. 
-            <strong>Let the Games begin!</strong> 🏆
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Center-aligned header and friendly invitation in one element
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Official links section
     st.markdown("### 🔗 Official Olympic Resources")
     col_left, col_right = st.columns(2)
     
     with col_left:
-        st.markdown("""
-        <div style='border: 2px solid #e5e7eb; border-radius: 10px; padding: 1rem; min-height: 200px; background-color: white; display: flex; flex-direction: column;'>
-            <h4 style='color: #1e3a8a; margin-top: 0;'>📰 Official Olympics Website</h4>
-            <p style='color: #6b7280; flex-grow: 1;'>Get official news, schedules, and athlete profiles</p>
-            <a href='https://www.olympics.com/en/milano-cortina-2026' target='_blank' style='text-decoration: none;'>
-                <div style='background-color: #3b82f6; color: white; padding: 0.75rem; border-radius: 5px; text-align: center; font-weight: bold;'>
-                    Visit Olympics.com →
-                </div>
-            </a>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(OLYMPICS_LINK_HTML, unsafe_allow_html=True)
     
     with col_right:
-        st.markdown("""
-        <div style='border: 2px solid #e5e7eb; border-radius: 10px; padding: 1rem; min-height: 200px; background-color: white; display: flex; flex-direction: column;'>
-            <h4 style='color: #1e3a8a; margin-top: 0;'>🎥 Official YouTube Channel</h4>
-            <p style='color: #6b7280; flex-grow: 1;'>Watch highlights, athlete stories, and live coverage</p>
-            <a href='https://www.youtube.com/@Olympics/streams' target='_blank' style='text-decoration: none;'>
-                <div style='background-color: #dc2626; color: white; padding: 0.75rem; border-radius: 5px; text-align: center; font-weight: bold;'>
-                    Watch on YouTube →
-                </div>
-            </a>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(YOUTUBE_LINK_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
 
 
-def render_stats_cards(df: pd.DataFrame):
-    """Render statistics cards"""
-    stats = OlympicsVisualizations.create_stats_cards(df)
-    
+def render_stats_cards(stats: dict):
+    """Render statistics cards from precomputed stats"""
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("📊 Total Events", stats["total_events"])
     
     with col2:
-        st.metric("🔴 Today", stats["upcoming_events"])
+        st.metric("🔴 Today", stats["today_events"])
     
     with col3:
         st.metric("⛷️ Sports", stats["sports_count"])
@@ -267,8 +651,9 @@ def render_stats_cards(df: pd.DataFrame):
         st.metric("🌍 Countries", stats["countries_count"])
 
 
-def render_live_dashboard_tab():
+def render_live_dashboard_tab(now: datetime = None):
     """Render Live Dashboard tab with filters"""
+    now = now or datetime.now()
     st.subheader("🏟️ Olympics Events Dashboard")
     
     # Filter bar
@@ -279,28 +664,18 @@ def render_live_dashboard_tab():
         # Date range filter
         date_range = st.date_input(
             "Date Range",
-            value=(datetime(2026, 2, 6).date(), datetime(2026, 2, 22).date()),
+            value=(OLYMPICS_START, OLYMPICS_END),
             key="live_date_range"
         )
     
     with col2:
         # Sport filter
-        sports_response = fetch_all_sports()
-        sports_list = sports_response.get("sports", []) if sports_response.get("success") else []
-        
-        sport_codes = ["All"]
-        sport_names_map = {"All": "All Sports"}
-        
-        for sport in sports_list:
-            if isinstance(sport, dict) and sport.get("code"):
-                code = sport.get("code")
-                name = OlympicsDataProcessor.get_sport_name(code).strip()
-                sport_codes.append(code)
-                sport_names_map[code] = name
+        codes = get_sport_codes()
+        sport_names_map = get_sport_filter_labels(codes)
         
         selected_sport = st.selectbox(
             "Sport",
-            options=sport_codes,
+            options=["All", *codes],
             format_func=lambda x: sport_names_map.get(x, x),
             key="live_sport_filter"
         )
@@ -315,72 +690,31 @@ def render_live_dashboard_tab():
     
     st.markdown("---")
     
-    # Fetch all events
-    all_response = fetch_all_events()
-    all_df = OlympicsDataProcessor.parse_events_response(all_response)
-    
-    if all_df.empty:
+    if get_events_df_view().empty:
         st.info("No events data available")
         return
     
-    # Apply filters
-    filtered_df = all_df.copy()
-    
-    # Date filter
-    if date_range and len(date_range) == 2:
-        milan_tz = pytz.timezone("Europe/Rome")
-        start_date = pd.Timestamp(date_range[0], tz=milan_tz)
-        end_date = pd.Timestamp(date_range[1], tz=milan_tz)
-        filtered_df = OlympicsDataProcessor.filter_by_date_range(filtered_df, start_date, end_date)
-    
-    # Sport filter
-    if selected_sport != "All":
-        filtered_df = OlympicsDataProcessor.filter_by_sport(filtered_df, selected_sport)
-    
-    # Status filter
-    if status_filter != "All Events" and "status" in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df["status"] == status_filter].copy()
+    # Apply filters through the cached pipeline, keyed on the widget values
+    date_from, date_to = date_range if date_range and len(date_range) == 2 else (None, None)
+    filters = (
+        date_from,
+        date_to,
+        selected_sport if selected_sport != "All" else None,
+        status_filter if status_filter != "All Events" else None
+    )
+    filtered_df = get_filtered_events_df(*filters)
     
     # Display events
     st.write(f"### 📅 Events")
     
     if not filtered_df.empty:
-        # Reset index and remove duplicates
-        filtered_df = filtered_df.reset_index(drop=True)
-        filtered_df = filtered_df.loc[:, ~filtered_df.columns.duplicated()]
-        
-        # Remove duplicate events
-        dedup_cols = []
-        if "event_name" in filtered_df.columns:
-            dedup_cols.append("event_name")
-        if "datetime" in filtered_df.columns:
-            dedup_cols.append("datetime")
-        if "venue_full" in filtered_df.columns:
-            dedup_cols.append("venue_full")
-        elif "venue" in filtered_df.columns:
-            dedup_cols.append("venue")
-        
-        if dedup_cols:
-            filtered_df = filtered_df.drop_duplicates(subset=dedup_cols, keep='first')
-        
-        # Create display DataFrame
-        event_names = list(filtered_df["event_name"].astype(str)) if "event_name" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        sport_codes = filtered_df["sport_code"] if "sport_code" in filtered_df.columns else pd.Series(["N/A"] * len(filtered_df))
-        sports = [str(OlympicsDataProcessor.get_sport_name(code)) for code in sport_codes]
-        disciplines = list(filtered_df["discipline_detailed"].astype(str)) if "discipline_detailed" in filtered_df.columns else sports
-        times = list(filtered_df["datetime"].dt.strftime("%b %d, %H:%M")) if "datetime" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        venue_col = "venue_full" if "venue_full" in filtered_df.columns else "venue"
-        venues = list(filtered_df[venue_col].astype(str)) if venue_col in filtered_df.columns else ["N/A"] * len(filtered_df)
-        statuses = list(filtered_df["status"].astype(str)) if "status" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        
-        display_df = pd.DataFrame({
-            "event_name": event_names,
-            "sport": sports,
-            "discipline": disciplines,
-            "date_time (CET)": times,
-            "venue": venues,
-            "status": statuses
-        })
+        # Create display DataFrame (reused while the filters are unchanged)
+        display_options = {
+            "time_label": "date_time (CET)",
+            "time_format": "%b %d, %H:%M",
+            "include_discipline": True
+        }
+        display_df = build_filtered_display_df(filters, **display_options)
         
         st.dataframe(
             display_df,
@@ -388,12 +722,11 @@ def render_live_dashboard_tab():
             hide_index=True
         )
         
-        # Export option
-        csv = display_df.to_csv(index=False)
+        # Export option (CSV bytes are cached per filter combination)
         st.download_button(
             label="📥 Download as CSV",
-            data=csv,
-            file_name=f"olympics_events_{datetime.now().strftime('%Y%m%d')}.csv",
+            data=get_csv_bytes(filters, **display_options),
+            file_name=f"olympics_events_{now.strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
         
@@ -402,11 +735,10 @@ def render_live_dashboard_tab():
             st.markdown("<br>", unsafe_allow_html=True)
             
             # Get current time in CET timezone
-            milan_tz = pytz.timezone("Europe/Rome")
-            now_cet = datetime.now(milan_tz)
+            now_cet = now.astimezone(MILAN_TZ)
             
             # Count past and future events based on datetime
-            completed_count = len(filtered_df[filtered_df["datetime"] < now_cet])
+            completed_count = int((filtered_df["datetime"] < now_cet).sum())
             total_count = len(filtered_df)
             remaining_count = total_count - completed_count
             
@@ -433,12 +765,12 @@ def render_live_dashboard_tab():
         
         with col1:
             # Sport events distribution pie chart
-            sport_fig = OlympicsVisualizations.create_sports_distribution_pie(filtered_df)
+            sport_fig = build_chart("create_sports_distribution_pie", get_chart_source(filtered_df))
             st.plotly_chart(sport_fig, use_container_width=True)
         
         with col2:
             # Venue usage pie chart
-            venue_fig = OlympicsVisualizations.create_venue_distribution_pie(filtered_df)
+            venue_fig = build_chart("create_venue_distribution_pie", get_chart_source(filtered_df))
             st.plotly_chart(venue_fig, use_container_width=True)
         
         # Sport Description Section
@@ -522,31 +854,19 @@ def render_podium_tab():
     # Note about data availability
     st.info("📌 **Note:** Medal results will be available once events are completed. Currently showing event participation data.")
     
-    # Fetch all events
-    all_response = fetch_all_events()
-    all_df = OlympicsDataProcessor.parse_events_response(all_response)
+    # Fetch and parse all events
+    all_df = get_events_df_view()
     
     if all_df.empty:
         st.warning("No events data available")
         return
     
-    # Get all countries
-    countries_set = set()
-    if "teams" in all_df.columns:
-        for teams in all_df["teams"]:
-            if teams is None or (isinstance(teams, float) and pd.isna(teams)):
-                continue
-            if isinstance(teams, list):
-                for team in teams:
-                    if isinstance(team, dict):
-                        code = team.get("code") or team.get("country_code")
-                        if code:
-                            countries_set.add(code.upper())
+    # Count participations per country (also gives the country list)
+    country_participation = OlympicsDataProcessor.get_team_country_counts(all_df)
     
-    if not countries_set:
-        countries_set = {"USA", "CAN", "ITA", "GER", "FRA", "JPN", "CHN", "KOR"}
-    
-    countries_list = sorted(list(countries_set))
+    countries_list = sorted(country_participation.index)
+    if not countries_list:
+        countries_list = sorted(["USA", "CAN", "ITA", "GER", "FRA", "JPN", "CHN", "KOR"])
     
     # Country selector
     col1, col2 = st.columns([1, 3])
@@ -563,7 +883,7 @@ def render_podium_tab():
     
     if selected_country:
         # Filter events for selected country
-        country_events = OlympicsDataProcessor.filter_by_country(all_df, selected_country)
+        country_events = get_country_events_df(selected_country)
         
         st.markdown("---")
         st.write(f"## {selected_country} - Olympic Performance")
@@ -595,34 +915,29 @@ def render_podium_tab():
             
             # Medal events
             st.write("### 🎯 Medal Events")
-            medal_events = country_events[country_events.get("is_medal_event", False) == True] if "is_medal_event" in country_events.columns else country_events
+            medal_events = country_events
+            if "is_medal_event" in country_events.columns:
+                medal_mask = country_events["is_medal_event"]
+                if medal_mask.dtype != bool:
+                    medal_mask = medal_mask.fillna(False).astype(bool)
+                # Every event is a medal event today, so skip the row copy when nothing is excluded
+                if not medal_mask.all():
+                    medal_events = country_events[medal_mask]
             
             if not medal_events.empty:
                 st.write(f"**{len(medal_events)} medal events** for {selected_country}")
                 
                 # Group by sport
                 if "sport_code" in medal_events.columns:
-                    sport_counts = medal_events.groupby("sport_code").size().reset_index(name="count")
-                    sport_counts["sport_name"] = sport_counts["sport_code"].apply(OlympicsDataProcessor.get_sport_name)
-                    sport_counts = sport_counts.sort_values("count", ascending=False)
-                    
-                    fig = go.Figure(data=[go.Bar(
-                        x=sport_counts["sport_name"],
-                        y=sport_counts["count"],
-                        marker=dict(color="#FFD700"),
-                        text=sport_counts["count"],
-                        textposition="outside"
-                    )])
-                    
-                    fig.update_layout(
-                        title=f"Medal Events by Sport - {selected_country}",
-                        xaxis_title="Sport",
-                        yaxis_title="Number of Events",
-                        height=400,
-                        showlegend=False,
-                        template="plotly_white"
-                    )
+                    # value_counts sorts descending; on a categorical it also lists unused sports, so drop zeros
+                    code_counts = medal_events["sport_code"].value_counts()
+                    code_counts = code_counts[code_counts > 0]
+                    sport_counts = pd.DataFrame({
+                        "sport_name": OlympicsDataProcessor.map_sport_names(pd.Series(code_counts.index)).to_numpy(),
+                        "count": code_counts.to_numpy()
+                    })
                     
+                    fig = build_medal_sports_chart(sport_counts, selected_country)
                     st.plotly_chart(fig, width="stretch")
         else:
             st.info(f"No events found for {selected_country}")
@@ -639,61 +954,28 @@ def render_podium_tab():
     # Show top countries by event participation as placeholder
     st.write("**Top Countries by Event Participation:**")
     
-    country_participation = {}
-    if "teams" in all_df.columns:
-        for idx, row in all_df.iterrows():
-            teams = row.get("teams")
-            if teams is None or (isinstance(teams, float) and pd.isna(teams)):
-                continue
-            if isinstance(teams, list):
-                for team in teams:
-                    if isinstance(team, dict):
-                        code = team.get("code") or team.get("country_code")
-                        if code:
-                            code = code.upper()
-                            country_participation[code] = country_participation.get(code, 0) + 1
-    
-    if country_participation:
-        # Sort and get top 10
-        sorted_countries = sorted(country_participation.items(), key=lambda x: x[1], reverse=True)[:10]
+    if not country_participation.empty:
+        # Partial sort for the top 10 (ties keep first appearance)
+        top_countries = country_participation.nlargest(10)
         
-        leaderboard_df = pd.DataFrame(sorted_countries, columns=["Country", "Events"])
+        leaderboard_df = pd.DataFrame({"Country": top_countries.index, "Events": top_countries.to_numpy()})
         leaderboard_df.index = range(1, len(leaderboard_df) + 1)
         leaderboard_df.index.name = "Rank"
         
         st.dataframe(leaderboard_df, width="stretch")
         
         # Visualization
-        fig = go.Figure(data=[go.Bar(
-            x=[item[0] for item in sorted_countries],
-            y=[item[1] for item in sorted_countries],
-            marker=dict(
-                color=[item[1] for item in sorted_countries],
-                colorscale=[[0, "#CD7F32"], [0.5, "#C0C0C0"], [1, "#FFD700"]],
-                showscale=False
-            ),
-            text=[item[1] for item in sorted_countries],
-            textposition="outside"
-        )])
-        
-        fig.update_layout(
-            title="Top 10 Countries by Event Participation",
-            xaxis_title="Country",
-            yaxis_title="Number of Events",
-            height=500,
-            template="plotly_white"
-        )
-        
+        fig = build_participation_chart(top_countries)
         st.plotly_chart(fig, width="stretch")
 
 
-def render_schedule_explorer_tab():
+def render_schedule_explorer_tab(now: datetime = None):
     """Render Schedule Explorer tab"""
+    now = now or datetime.now()
     st.subheader("📅 Schedule Explorer")
     
-    # Fetch all events
-    all_response = fetch_all_events()
-    all_df = OlympicsDataProcessor.parse_events_response(all_response)
+    # Fetch all events, deduplicated once per parse
+    all_df = get_unique_events_df()
     
     if all_df.empty:
         st.warning("No events data available")
@@ -705,22 +987,20 @@ def render_schedule_explorer_tab():
     with col1:
         date_range = st.date_input(
             "Select Date Range",
-            value=(datetime(2026, 2, 6).date(), datetime(2026, 2, 22).date()),
+            value=(OLYMPICS_START, OLYMPICS_END),
             key="schedule_date_range"
         )
     
     with col2:
-        sports_response = fetch_all_sports()
-        sports_list = sports_response.get("sports", []) if sports_response.get("success") else []
+        api_sport_codes = get_sport_codes()
         
         # Fallback to sports from DataFrame if API fails
-        if not sports_list and "sport_code" in all_df.columns:
+        if not api_sport_codes and "sport_code" in all_df.columns:
             unique_codes = all_df["sport_code"].dropna().unique()
-            sport_codes = [str(code) for code in unique_codes if code]
-            sport_names = [OlympicsDataProcessor.get_sport_name(code) for code in sport_codes]
+            sport_codes = tuple(str(code) for code in unique_codes if code)
         else:
-            sport_codes = [s.get("code") for s in sports_list if isinstance(s, dict) and s.get("code")]
-            sport_names = [OlympicsDataProcessor.get_sport_name(code) for code in sport_codes if code]
+            sport_codes = api_sport_codes
+        sport_names = list(get_sport_name_map(sport_codes).values())
         
         # Ensure we have at least some sports to show
         if not sport_names:
@@ -735,33 +1015,15 @@ def render_schedule_explorer_tab():
     with col3:
         st.write("")  # Spacer
     
-    # Apply filters
-    filtered_df = all_df.copy()
-    
-    if date_range and len(date_range) == 2:
-        # Convert to timezone-aware timestamps (Europe/Rome)
-        milan_tz = pytz.timezone("Europe/Rome")
-        start_date = pd.Timestamp(date_range[0], tz=milan_tz)
-        end_date = pd.Timestamp(date_range[1], tz=milan_tz)
-        filtered_df = OlympicsDataProcessor.filter_by_date_range(filtered_df, start_date, end_date)
-    
-    if selected_sport != "All" and sports_list:
-        # Build sport code mapping safely
-        sport_code_map = {}
-        for s in sports_list:
-            if isinstance(s, dict) and s.get("code"):
-                code = s.get("code")
-                sport_code_map[code] = OlympicsDataProcessor.get_sport_name(code)
-        
+    sport_code = None
+    if selected_sport != "All" and api_sport_codes:
         # Find matching sport code
-        sport_code = None
-        for code, name in sport_code_map.items():
-            if name == selected_sport:
-                sport_code = code
-                break
-        
-        if sport_code:
-            filtered_df = OlympicsDataProcessor.filter_by_sport(filtered_df, sport_code)
+        sport_code = get_sport_codes_by_name(sport_codes).get(selected_sport)
+    
+    # Apply filters through the cached pipeline, keyed on the widget values
+    date_from, date_to = date_range if date_range and len(date_range) == 2 else (None, None)
+    filters = (date_from, date_to, sport_code, None)
+    filtered_df = get_filtered_events_df(*filters)
     
     st.markdown("---")
     
@@ -771,7 +1033,7 @@ def render_schedule_explorer_tab():
     with col_timeline:
         st.write(f"### 📊 Events Timeline ({len(filtered_df)} events)")
         if not filtered_df.empty:
-            fig = OlympicsVisualizations.create_events_timeline(filtered_df, max_events=30)
+            fig = build_chart("create_events_timeline", get_chart_source(filtered_df), max_events=30)
             st.plotly_chart(fig, width="stretch")
         else:
             st.info("No events match the selected filters")
@@ -779,49 +1041,14 @@ def render_schedule_explorer_tab():
     with col_stats:
         st.write("### 📍 Distribution")
         if not filtered_df.empty:
-            fig = OlympicsVisualizations.create_sports_distribution(filtered_df)
+            fig = build_chart("create_sports_distribution", get_chart_source(filtered_df))
             st.plotly_chart(fig, width="stretch", config={"displayModeBar": False})
     
     # Detailed table
     st.write("### 📋 Event Details")
     if not filtered_df.empty:
-        # Reset index and ensure no duplicate columns
-        filtered_df = filtered_df.reset_index(drop=True)
-        filtered_df = filtered_df.loc[:, ~filtered_df.columns.duplicated()]
-        
-        # Remove duplicate events based on event_name, datetime, and venue
-        dedup_cols = []
-        if "event_name" in filtered_df.columns:
-            dedup_cols.append("event_name")
-        if "datetime" in filtered_df.columns:
-            dedup_cols.append("datetime")
-        if "venue_full" in filtered_df.columns:
-            dedup_cols.append("venue_full")
-        elif "venue" in filtered_df.columns:
-            dedup_cols.append("venue")
-        
-        if dedup_cols:
-            filtered_df = filtered_df.drop_duplicates(subset=dedup_cols, keep='first')
-        
-        # Create clean DataFrame with safe extraction
-        event_names = list(filtered_df["event_name"].astype(str)) if "event_name" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        sport_codes = filtered_df["sport_code"] if "sport_code" in filtered_df.columns else pd.Series(["N/A"] * len(filtered_df))
-        sports = [str(OlympicsDataProcessor.get_sport_name(code)) for code in sport_codes]
-        date_times = list(filtered_df["datetime"].dt.strftime("%Y-%m-%d %H:%M")) if "datetime" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        # Use venue_full if available, otherwise fallback to venue
-        venue_col = "venue_full" if "venue_full" in filtered_df.columns else "venue"
-        venues = list(filtered_df[venue_col].astype(str)) if venue_col in filtered_df.columns else ["N/A"] * len(filtered_df)
-        cities = list(filtered_df["city"].astype(str)) if "city" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        statuses = list(filtered_df["status"].astype(str)) if "status" in filtered_df.columns else ["N/A"] * len(filtered_df)
-        
-        display_df = pd.DataFrame({
-            "event_name": event_names,
-            "sport": sports,
-            "date_time": date_times,
-            "venue": venues,
-            "city": cities,
-            "status": statuses
-        })
+        # Create clean DataFrame (reused while the filters are unchanged)
+        display_df = build_filtered_display_df(filters, include_city=True)
         
         st.dataframe(
             display_df,
@@ -829,49 +1056,70 @@ def render_schedule_explorer_tab():
             hide_index=True
         )
         
-        # Export option
-        csv = display_df.to_csv(index=False)
+        # Export option (CSV bytes are cached per filter combination)
         st.download_button(
             label="📥 Download as CSV",
-            data=csv,
-            file_name=f"olympics_schedule_{datetime.now().strftime('%Y%m%d')}.csv",
+            data=get_csv_bytes(filters, include_city=True),
+            file_name=f"olympics_schedule_{now.strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
 
 
+@st.fragment
+def render_country_schedule(country_code: str):
+    """Render a country's sport filter and event table (reruns on its own when the filter changes)"""
+    st.write("### 📅 Country's Event Schedule")
+    
+    # Filter by sport for this country
+    api_sport_codes = get_sport_codes()
+    
+    # Fallback to sports from country events
+    sport_codes = api_sport_codes or get_country_sport_codes(country_code)
+    sport_names = list(get_sport_name_map(sport_codes).values())
+    
+    # Ensure at least one option
+    if not sport_names:
+        sport_names = ["Alpine Skiing", "Ice Hockey"]
+    
+    selected_sport = st.selectbox(
+        "Filter by Sport",
+        options=["All"] + sport_names,
+        key="country_sport_filter"
+    )
+    
+    sport_code = None
+    if selected_sport != "All" and api_sport_codes:
+        # Find matching sport code
+        sport_code = get_sport_codes_by_name(sport_codes).get(selected_sport)
+    
+    # Cached on the country and sport codes, so reruns don't hash the events frame
+    display_df = build_country_display_df(country_code, sport_code)
+    
+    if not display_df.empty:
+        st.dataframe(
+            display_df,
+            width="stretch",
+            hide_index=True
+        )
+
+
 def render_country_tracker_tab():
     """Render Country Tracker tab"""
     st.subheader("🌍 Country Tracker")
     
     # Fetch countries and events
-    all_response = fetch_all_events()
-    all_df = OlympicsDataProcessor.parse_events_response(all_response)
+    all_df = get_events_df_view()
     
     if all_df.empty:
         st.warning("No events data available")
         return
     
     # Get unique countries
-    countries_set = set()
-    if "teams" in all_df.columns:
-        for idx, teams in enumerate(all_df["teams"]):
-            # Skip None, NaN, or empty values - handle arrays safely
-            if teams is None or (isinstance(teams, float) and pd.isna(teams)):
-                continue
-            if not teams:  # Skip empty lists/dicts
-                continue
-            if isinstance(teams, list):
-                for team in teams:
-                    if isinstance(team, dict) and "code" in team and team["code"]:
-                        countries_set.add(team["code"])
-            elif isinstance(teams, dict) and "code" in teams and teams["code"]:
-                countries_set.add(teams["code"])
+    countries_list = get_country_codes()
     
     # Add fallback countries if none found
-    if not countries_set:
-        countries_set = {"USA", "CAN", "ITA", "GER", "FRA", "JPN", "CHN", "KOR", "NOR", "SWE"}
-    
-    countries_list = sorted(list(countries_set))
+    if not countries_list:
+        countries_list = sorted(["USA", "CAN", "ITA", "GER", "FRA", "JPN", "CHN", "KOR", "NOR", "SWE"])
     
     col1, col2 = st.columns([1, 3])
     
@@ -887,23 +1135,21 @@ def render_country_tracker_tab():
     
     if selected_country:
         # Filter events for selected country
-        country_events = OlympicsDataProcessor.filter_by_country(all_df, selected_country)
+        country_events = get_country_events_df(selected_country)
         
         st.markdown("---")
         st.write(f"## {selected_country} - Events")
         
         if not country_events.empty:
             # Stats
+            stats = get_country_stats(selected_country)
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("📊 Total Events", len(country_events))
+                st.metric("📊 Total Events", stats["total"])
             with col2:
-                # Count events that haven't happened yet (status not Completed)
-                upcoming = len(country_events[country_events["status"] != "Completed"])
-                st.metric("🔴 Upcoming", upcoming)
+                st.metric("🔴 Upcoming", stats["upcoming"])
             with col3:
-                sports_count = country_events["sport_code"].nunique() if "sport_code" in country_events.columns else 0
-                st.metric("⛷️ Sports Involved", sports_count)
+                st.metric("⛷️ Sports Involved", stats["sports"])
             
             st.markdown("---")
             
@@ -911,96 +1157,11 @@ def render_country_tracker_tab():
             col_left, col_right = st.columns([2, 1])
             
             with col_left:
-                st.write("### 📅 Country's Event Schedule")
-                
-                # Filter by sport for this country
-                sports_response = fetch_all_sports()
-                sports_list = sports_response.get("sports", []) if sports_response.get("success") else []
-                
-                # Fallback to sports from country events
-                if not sports_list and "sport_code" in country_events.columns:
-                    unique_codes = country_events["sport_code"].dropna().unique()
-                    sport_codes = [str(code) for code in unique_codes if code]
-                    sport_names = [OlympicsDataProcessor.get_sport_name(code) for code in sport_codes]
-                else:
-                    sport_codes = [s.get("code") for s in sports_list if isinstance(s, dict) and s.get("code")]
-                    sport_names = [OlympicsDataProcessor.get_sport_name(code) for code in sport_codes if code]
-                
-                # Ensure at least one option
-                if not sport_names:
-                    sport_names = ["Alpine Skiing", "Ice Hockey"]
-                
-                selected_sport = st.selectbox(
-                    "Filter by Sport",
-                    options=["All"] + sport_names,
-                    key="country_sport_filter"
-                )
-                
-                filtered_country_events = country_events.copy()
-                if selected_sport != "All" and sports_list:
-                    # Build sport code mapping safely
-                    sport_code_map = {}
-                    for s in sports_list:
-                        if isinstance(s, dict) and s.get("code"):
-                            code = s.get("code")
-                            sport_code_map[code] = OlympicsDataProcessor.get_sport_name(code)
-                    
-                    # Find matching sport code
-                    sport_code = None
-                    for code, name in sport_code_map.items():
-                        if name == selected_sport:
-                            sport_code = code
-                            break
-                    
-                    if sport_code:
-                        filtered_country_events = OlympicsDataProcessor.filter_by_sport(filtered_country_events, sport_code)
-                
-                if not filtered_country_events.empty:
-                    # Reset index and ensure no duplicate columns
-                    filtered_country_events = filtered_country_events.reset_index(drop=True)
-                    filtered_country_events = filtered_country_events.loc[:, ~filtered_country_events.columns.duplicated()]
-                    
-                    # Remove duplicate events
-                    dedup_cols = []
-                    if "event_name" in filtered_country_events.columns:
-                        dedup_cols.append("event_name")
-                    if "datetime" in filtered_country_events.columns:
-                        dedup_cols.append("datetime")
-                    if "venue_full" in filtered_country_events.columns:
-                        dedup_cols.append("venue_full")
-                    elif "venue" in filtered_country_events.columns:
-                        dedup_cols.append("venue")
-                    
-                    if dedup_cols:
-                        filtered_country_events = filtered_country_events.drop_duplicates(subset=dedup_cols, keep='first')
-                    
-                    # Create clean DataFrame with safe extraction
-                    event_names = list(filtered_country_events["event_name"].astype(str)) if "event_name" in filtered_country_events.columns else ["N/A"] * len(filtered_country_events)
-                    sport_codes = filtered_country_events["sport_code"] if "sport_code" in filtered_country_events.columns else pd.Series(["N/A"] * len(filtered_country_events))
-                    sports = [str(OlympicsDataProcessor.get_sport_name(code)) for code in sport_codes]
-                    date_times = list(filtered_country_events["datetime"].dt.strftime("%Y-%m-%d %H:%M")) if "datetime" in filtered_country_events.columns else ["N/A"] * len(filtered_country_events)
-                    # Use venue_full if available
-                    venue_col = "venue_full" if "venue_full" in filtered_country_events.columns else "venue"
-                    venues = list(filtered_country_events[venue_col].astype(str)) if venue_col in filtered_country_events.columns else ["N/A"] * len(filtered_country_events)
-                    statuses = list(filtered_country_events["status"].astype(str)) if "status" in filtered_country_events.columns else ["N/A"] * len(filtered_country_events)
-                    
-                    display_df = pd.DataFrame({
-                        "event_name": event_names,
-                        "sport": sports,
-                        "date_time": date_times,
-                        "venue": venues,
-                        "status": statuses
-                    })
-                    
-                    st.dataframe(
-                        display_df,
-                        width="stretch",
-                        hide_index=True
-                    )
+                render_country_schedule(selected_country)
             
             with col_right:
                 st.write("### ⛷️ Sports Breakdown")
-                fig = OlympicsVisualizations.create_sports_distribution(country_events)
+                fig = build_country_chart("create_sports_distribution", selected_country)
                 st.plotly_chart(fig, width="stretch", config={"displayModeBar": False})
         else:
             st.info(f"No events found for {selected_country}")
@@ -1010,15 +1171,14 @@ def render_analytics_tab():
     """Render Analytics tab"""
     st.subheader("📊 Analytics & Insights")
     
-    # Fetch all events
-    all_response = fetch_all_events()
-    all_df = OlympicsDataProcessor.parse_events_response(all_response)
+    # Fetch and parse all events
+    all_df = get_events_df_view()
     
     if all_df.empty:
         st.warning("No events data available for analytics")
         return
     
-    render_stats_cards(all_df)
+    render_stats_cards(get_events_stats())
     st.markdown("---")
     
     # Analytics layout
@@ -1030,19 +1190,19 @@ def render_analytics_tab():
     ])
     
     with tab1:
-        fig = OlympicsVisualizations.create_sports_distribution(all_df)
+        fig = build_events_chart("create_sports_distribution")
         st.plotly_chart(fig, width="stretch")
     
     with tab2:
-        fig = OlympicsVisualizations.create_venue_distribution(all_df)
+        fig = build_events_chart("create_venue_distribution")
         st.plotly_chart(fig, width="stretch")
     
     with tab3:
-        fig = OlympicsVisualizations.create_hourly_distribution(all_df)
+        fig = build_events_chart("create_hourly_distribution")
         st.plotly_chart(fig, width="stretch")
     
     with tab4:
-        fig = OlympicsVisualizations.create_events_by_status(all_df)
+        fig = build_events_chart("create_events_by_status")
         st.plotly_chart(fig, width="stretch")
 
 
@@ -1051,24 +1211,33 @@ def render_sidebar():
     with st.sidebar:
         st.markdown("### ⚙️ Settings")
         
-        # Refresh settings
-        st.markdown("**Auto Refresh**")
-        auto_refresh = st.checkbox(
-            "Enable auto-refresh",
-            value=st.session_state.get("auto_refresh_enabled", True),
-            key="auto_refresh"
-        )
-        
-        refresh_interval = st.slider(
-            "Refresh interval (minutes)",
-            min_value=1840,
-            max_value=2000,
-            value=st.session_state.get("refresh_interval", 10),
-            key="refresh_slider"
-        )
+        # Refresh settings (batched in a form so changing them doesn't rerun the whole app)
+        with st.form("refresh_settings"):
+            st.markdown("**Auto Refresh**")
+            auto_refresh = st.checkbox(
+                "Enable auto-refresh",
+                value=st.session_state.get("auto_refresh_enabled", True),
+                key="auto_refresh"
+            )
+            
+            refresh_interval = st.slider(
+                "Refresh interval (minutes)",
+                min_value=1,
+                max_value=60,
+                value=st.session_state.get("refresh_interval", 10),
+                key="refresh_slider"
+            )
+            
+            if st.form_submit_button("Apply"):
+                st.session_state["auto_refresh_enabled"] = auto_refresh
+                st.session_state["refresh_interval"] = refresh_interval
         
         if st.button("🔄 Refresh Now"):
             st.cache_data.clear()
+            # Shared event frames live in the resource cache
+            for shared_frame in (get_events_df_view, get_unique_events_df, get_country_events_df, get_filtered_events_df):
+                shared_frame.clear()
+            st.session_state.pop("api_prefetched", None)
             st.rerun()
         
         st.markdown("---")
@@ -1106,6 +1275,9 @@ def render_sidebar():
 
 def main():
     """Main application"""
+    # Single timestamp shared by everything rendered in this pass
+    now = datetime.now()
+    
     # Initialize session state
     StreamlitHelpers.initialize_session_state()
     
@@ -1115,6 +1287,9 @@ def main():
     # Render sidebar
     render_sidebar()
     
+    # Fetch independent API data in parallel on a cold start
+    prefetch_api_data()
+    
     # Main tabs
     # Only Live Dashboard active - other tabs commented out for now
     tab1 = st.tabs([
@@ -1130,7 +1305,7 @@ def main():
     # ])
     
     with tab1:
-        render_live_dashboard_tab()
+        render_live_dashboard_tab(now)
     
     # Podium tab - commented out
     # with tab2:
@@ -1138,7 +1313,7 @@ def main():
     
     # Schedule tab - removed
     # with tab3:
-    #     render_schedule_explorer_tab()
+    #     render_schedule_explorer_tab(now)
     
     # Country Tracker tab - removed
     # with tab4:
@@ -1178,15 +1353,10 @@ def main():
         st.caption("💡 View online with embedded videos")
     
     with col2:
-        # Download PowerPoint file
-        try:
-            ppt_path = os.path.join(os.path.dirname(__file__), "src", "MWN Olympic Games downhill skiing presentation 2126.pptx")
-            if not os.path.exists(ppt_path):
-                ppt_path = "src/MWN Olympic Games downhill skiing presentation 2126.pptx"
-            
-            with open(ppt_path, "rb") as file:
-                ppt_data = file.read()
-            
+        # Download PowerPoint file (read from disk once, then served from the cache)
+        ppt_data = load_presentation()
+        
+        if ppt_data is not None:
             st.download_button(
                 label="📥 Download PowerPoint",
                 data=ppt_data,
@@ -1196,7 +1366,7 @@ def main():
                 use_container_width=True
             )
             st.caption("📂 Download for offline viewing")
-        except Exception as e:
+        else:
             st.caption("⚠️ Download unavailable")
     
     # Footer
@@ -1204,7 +1374,7 @@ def main():
     st.markdown(
         "<p style='text-align: center; color: gray; font-size: 0.8rem;'>"
         "🏅 Milano-Cortina 2026 Winter Olympics | Last updated: " + 
-        datetime.now().strftime("%Y-%m-%d %H:%M:%S") +
+        now.strftime("%Y-%m-%d %H:%M:%S") +
         "</p>",
         unsafe_allow_html=True
     )
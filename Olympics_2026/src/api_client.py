@@ -5,9 +5,15 @@ Handles all API requests to RapidAPI Olympics endpoint
 
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlencode
 
+try:
+    import orjson  # Faster JSON decoding for large event payloads
+except ImportError:
+    orjson = None
+
 
 class MilanoCortina2026API:
     """
@@ -19,6 +25,8 @@ class MilanoCortina2026API:
     BASE_URL = "https://milano-cortina-2026-olympics-api.p.rapidapi.com"
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
     
     def __init__(self, api_key: str):
         """
@@ -32,6 +40,12 @@ class MilanoCortina2026API:
             "X-RapidAPI-Key": api_key,
             "X-RapidAPI-Host": "milano-cortina-2026-olympics-api.p.rapidapi.com"
         }
+        
+        # Reuse keep-alive connections across requests (retries stay in _make_request)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
     
     def _make_request(
         self, 
@@ -57,9 +71,8 @@ class MilanoCortina2026API:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = requests.get(
+                response = self.session.get(
                     url,
-                    headers=self.headers,
                     params=params,
                     timeout=timeout
                 )
@@ -77,7 +90,7 @@ class MilanoCortina2026API:
                     )
                 
                 response.raise_for_status()
-                return response.json()
+                return self._decode_json(response)
                 
             except requests.exceptions.RequestException as e:
                 if attempt < self.MAX_RETRIES - 1:
@@ -89,6 +102,17 @@ class MilanoCortina2026API:
         
         return {"success": False, "events": []}
     
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Dict[str, Any]:
+        """Decode a JSON response body, using orjson when it is installed"""
+        if orjson is None:
+            return response.json()
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Surface as a request error so the retry loop treats it like response.json() failures
+            raise requests.exceptions.RequestException(f"Invalid JSON response: {e}") from e
+    
     # ==================== Events Endpoints ====================
     
     def get_all_events(
@@ -3,11 +3,16 @@ Data Processing Module for Olympics Events
 Transforms raw API responses into clean, usable DataFrames
 """
 
+import functools
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import pytz
 
+# Games timezone, resolved once at import
+MILAN_TZ = pytz.timezone("Europe/Rome")
+
 
 class OlympicsDataProcessor:
     """
@@ -35,6 +40,43 @@ class OlympicsDataProcessor:
         "smt": "Ski Mountaineering"
     }
     
+    # Emoji per sport code
+    EMOJI_MAP = {
+        "alp": "⛷️",
+        "iho": "🏒",
+        "fsk": "🎭",
+        "ssk": "⛸️",
+        "stk": "⛸️",
+        "cur": "🥌",
+        "bth": "🎯",
+        "ccs": "🏂",
+        "sjp": "🛷",
+        "ncb": "⛷️",
+        "frs": "🏂",
+        "sbd": "🏂",
+        "bob": "🛷",
+        "skn": "🛷",
+        "lug": "🛷",
+        "smt": "⛰️"
+    }
+    
+    # Emoji per event status
+    STATUS_EMOJI = {
+        "Completed": "✅",
+        "Today": "🟡",
+        "Upcoming": "🔴",
+        "Scheduled": "⚪"
+    }
+    
+    # Fixed status buckets, so every parse and filtered frame shares one categorical dtype
+    STATUS_DTYPE = pd.CategoricalDtype(["Completed", "Upcoming", "Today", "Scheduled"])
+    
+    # Low-cardinality string columns stored as categoricals after parsing
+    CATEGORY_COLUMNS = ("sport_code", "status", "venue_full", "venue_name", "city", "venue_country")
+    
+    # Display columns guaranteed after parsing, filled with "N/A" when the API omits them
+    DISPLAY_COLUMNS = ("event_name", "venue", "city")
+    
     # Discipline patterns for categorization
     DISCIPLINE_TYPES = {
         "downhill": ["downhill"],
@@ -73,13 +115,19 @@ class OlympicsDataProcessor:
         if df.empty:
             return df
         
-        # Parse dates and times
-        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce")
+        # Parse date and time in one pass; the date is derived from the result
+        raw_dates = df["date"]
         df["datetime"] = pd.to_datetime(
-            df["date"].astype(str) + " " + df.get("time", "00:00"),
+            raw_dates.astype(str) + " " + df.get("time", "00:00"),
             format="%Y-%m-%d %H:%M",
             errors="coerce"
         )
+        df["date"] = df["datetime"].dt.normalize()
+        
+        # Rows with a valid date but a missing or malformed time still keep their date
+        missing_dates = df["date"].isna()
+        if missing_dates.any():
+            df.loc[missing_dates, "date"] = pd.to_datetime(raw_dates[missing_dates], format="%Y-%m-%d", errors="coerce")
         
         # Extract venue information and create readable venue strings
         if "venue" in df.columns and df["venue"].notna().any():
@@ -149,6 +197,25 @@ class OlympicsDataProcessor:
         if dedup_cols and len(df) > 0:
             df = df.drop_duplicates(subset=dedup_cols, keep='first')
         
+        # Drop duplicate columns and renumber the filtered rows once here so callers don't have to
+        if df.columns.has_duplicates:
+            df = df.loc[:, ~df.columns.duplicated()]
+        df = df.reset_index(drop=True)
+        
+        # Normalize the schema so display code can read these columns directly
+        for col in OlympicsDataProcessor.DISPLAY_COLUMNS:
+            if col not in df.columns:
+                df[col] = "N/A"
+        
+        # Normalize team lists once so participation counts don't re-walk the team dicts
+        if "teams" in df.columns:
+            df["team_codes"] = df["teams"].map(OlympicsDataProcessor._extract_team_codes)
+        
+        # Store low-cardinality columns as categoricals for faster filters and groupbys
+        for col in OlympicsDataProcessor.CATEGORY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        
         return df
     
     @staticmethod
@@ -234,24 +301,26 @@ class OlympicsDataProcessor:
         """Add computed columns for filtering and display"""
         
         # Get current time in Milan timezone
-        milan_tz = pytz.timezone("Europe/Rome")
-        now = datetime.now(milan_tz)
+        now = datetime.now(MILAN_TZ)
         
         # Make datetime timezone-aware (Milan timezone)
         if df["datetime"].dt.tz is None:
-            df["datetime"] = df["datetime"].dt.tz_localize("UTC").dt.tz_convert(milan_tz)
+            df["datetime"] = df["datetime"].dt.tz_localize("UTC").dt.tz_convert(MILAN_TZ)
         else:
-            df["datetime"] = df["datetime"].dt.tz_convert(milan_tz)
+            df["datetime"] = df["datetime"].dt.tz_convert(MILAN_TZ)
         
         # Time calculations
         df["time_until_event"] = df["datetime"] - now
         df["hours_until"] = df["time_until_event"].dt.total_seconds() / 3600
         
-        # Status determination
-        df["status"] = "Scheduled"
-        df.loc[df["hours_until"] < 0, "status"] = "Completed"
-        df.loc[(df["hours_until"] >= 0) & (df["hours_until"] < 2), "status"] = "Upcoming"
-        df.loc[(df["hours_until"] >= 2) & (df["hours_until"] < 24), "status"] = "Today"
+        # Status determination in one pass (first matching bucket wins; NaN stays "Scheduled")
+        hours = df["hours_until"].to_numpy()
+        status = np.select(
+            [hours < 0, hours < 2, hours < 24],
+            ["Completed", "Upcoming", "Today"],
+            default="Scheduled"
+        )
+        df["status"] = pd.Categorical(status, dtype=OlympicsDataProcessor.STATUS_DTYPE)
         
         # Date flags
         df["is_today"] = df["date"].dt.date == now.date()
@@ -277,42 +346,103 @@ class OlympicsDataProcessor:
         if df.empty or "teams" not in df.columns:
             return df
         
-        # Check if country appears in teams
-        def check_country(teams_value):
-            """Safely check if country is in teams, handling all types"""
-            try:
-                # Handle None and scalar NaN
-                if teams_value is None:
-                    return False
-                if isinstance(teams_value, float) and pd.isna(teams_value):
-                    return False
-                # Handle empty values
-                if not teams_value:
-                    return False
-                # Check list of teams
-                if isinstance(teams_value, list):
-                    for team in teams_value:
-                        if isinstance(team, dict):
-                            # Check both 'code' and 'country_code' fields
-                            if team.get("code") == country_code or team.get("country_code") == country_code:
-                                return True
-                            # Also check if code/country_code is in the team name or abbreviation
-                            team_code = team.get("code", "").upper()
-                            if country_code.upper() == team_code:
-                                return True
-                return False
-            except (ValueError, TypeError):
-                return False
-        
-        mask = df["teams"].apply(check_country)
-        return df[mask].copy()
+        # Match on the exploded team dicts, then map the hits back to row positions
+        teams = OlympicsDataProcessor._explode_teams(df["teams"].reset_index(drop=True), include_single_teams=False)
+        codes = teams.str.get("code")
+        matches = (
+            codes.eq(country_code)
+            | teams.str.get("country_code").eq(country_code)
+            | codes.fillna("").astype(str).str.upper().eq(country_code.upper())
+        )
+        
+        positions = matches.index[matches.to_numpy(dtype=bool)].unique()
+        return df.iloc[positions]
+    
+    @staticmethod
+    def _extract_team_codes(teams: Any) -> List[str]:
+        """Upper-case country codes of a team list ("code", falling back to "country_code")"""
+        if not isinstance(teams, list):
+            return []
+        codes = (team.get("code") or team.get("country_code") for team in teams if isinstance(team, dict))
+        return [str(code).upper() for code in codes if code]
+    
+    @staticmethod
+    def _explode_teams(teams: pd.Series, include_single_teams: bool = True) -> pd.Series:
+        """Explode team lists into one team dict per row, optionally keeping bare single-team dicts"""
+        exploded = teams[teams.map(lambda t: isinstance(t, list))].explode()
+        if include_single_teams:
+            # explode would iterate a bare dict's keys, so dict rows are added back unexploded
+            single_teams = teams[teams.map(lambda t: isinstance(t, dict))]
+            exploded = pd.concat([exploded, single_teams]).sort_index(kind="stable")
+        exploded = exploded.dropna()
+        # Object dtype keeps .str.get working when no teams are left (e.g. a string-only column)
+        return exploded[exploded.map(lambda t: isinstance(t, dict))].astype(object)
+    
+    @staticmethod
+    def get_team_country_codes(df: pd.DataFrame) -> List[str]:
+        """Get sorted unique country codes from the teams column"""
+        if df.empty or "teams" not in df.columns:
+            return []
+        
+        teams = OlympicsDataProcessor._explode_teams(df["teams"])
+        
+        # Dedup on a typed string column rather than Python objects
+        codes = teams.str.get("code").dropna().astype("string")
+        codes = codes[codes.str.len() > 0]
+        return sorted(codes.unique().tolist())
+
+    @staticmethod
+    def get_team_country_counts(df: pd.DataFrame, include_single_teams: bool = False) -> pd.Series:
+        """
+        Count event participations per country from team lists
+
+        Args:
+            df: Events DataFrame
+            include_single_teams: Also count teams given as a bare dict instead of a list
+
+        Returns:
+            Series of event counts indexed by upper-case country code, in order of first appearance
+        """
+        if df.empty or "teams" not in df.columns:
+            return pd.Series(dtype="int64")
+
+        # Parsed frames carry the normalized list-team codes already
+        if not include_single_teams and "team_codes" in df.columns:
+            return df["team_codes"].explode().dropna().astype(str).value_counts(sort=False)
+
+        teams = OlympicsDataProcessor._explode_teams(df["teams"], include_single_teams)
+
+        # Prefer "code", falling back to "country_code" when it is missing or empty
+        codes = teams.str.get("code")
+        codes = codes.where(codes.astype(bool) & codes.notna(), teams.str.get("country_code"))
+        codes = codes[codes.notna() & codes.astype(bool)].astype(str).str.upper()
+
+        return codes.value_counts(sort=False)
+
+    @staticmethod
+    def drop_duplicate_events(df: pd.DataFrame) -> pd.DataFrame:
+        """Drop duplicate columns and events sharing name, start time and venue (keeps the first)"""
+        unique_cols = ~df.columns.duplicated() if df.columns.has_duplicates else slice(None)
+        venue_col = "venue_full" if "venue_full" in df.columns else "venue"
+        dedup_cols = [col for col in ("event_name", "datetime", venue_col) if col in df.columns]
+        if dedup_cols:
+            # Hash the mixed-dtype subset into one uint64 key so duplicated() runs on a single column
+            keys = pd.util.hash_pandas_object(df.loc[:, unique_cols][dedup_cols], index=False)
+            keep_rows = ~keys.duplicated()
+        else:
+            keep_rows = slice(None)
+        
+        # Slice rows and columns in one pass; the index is left as-is since callers only read values
+        if isinstance(keep_rows, pd.Series) and keep_rows.all() and isinstance(unique_cols, slice):
+            return df
+        return df.loc[keep_rows, unique_cols]
     
     @staticmethod
     def filter_by_sport(df: pd.DataFrame, sport_code: str) -> pd.DataFrame:
         """Filter events by sport code"""
         if df.empty or "sport_code" not in df.columns:
             return pd.DataFrame()
-        return df[df["sport_code"] == sport_code].copy()
+        return df[df["sport_code"].eq(sport_code)]
     
     @staticmethod
     def filter_by_date_range(
@@ -324,30 +454,100 @@ class OlympicsDataProcessor:
         if df.empty or "datetime" not in df.columns:
             return pd.DataFrame()
         
-        result = df.copy()
+        bounds = OlympicsDataProcessor._sorted_date_range_bounds(df, date_from, date_to)
+        if bounds:
+            # A range covering every event (e.g. the default full Games window) is a no-op
+            if bounds == (0, len(df)):
+                return df
+            return df.iloc[bounds[0]:bounds[1]]
+        return df[OlympicsDataProcessor.date_range_mask(df, date_from, date_to)]
+    
+    @staticmethod
+    def _sorted_date_range_bounds(
+        df: pd.DataFrame,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Optional[tuple]:
+        """Row positions (start, stop) of a date range via binary search, or None if not time-sorted"""
+        times = df["datetime"]
+        if times.hasnans or not times.is_monotonic_increasing:
+            return None
+        
+        start = times.searchsorted(date_from, side="left") if date_from else 0
+        if date_to:
+            # Include entire end date by adding 23:59:59
+            end_of_day = date_to + pd.Timedelta(hours=23, minutes=59, seconds=59)
+            stop = times.searchsorted(end_of_day, side="right")
+        else:
+            stop = len(times)
+        return int(start), int(max(start, stop))
+    
+    @staticmethod
+    def date_range_mask(
+        df: pd.DataFrame,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> pd.Series:
+        """Boolean mask of events within a date range (end date inclusive)"""
+        bounds = OlympicsDataProcessor._sorted_date_range_bounds(df, date_from, date_to)
+        if bounds:
+            mask = pd.Series(False, index=df.index)
+            mask.iloc[bounds[0]:bounds[1]] = True
+            return mask
+        
+        mask = pd.Series(True, index=df.index)
         if date_from:
-            result = result[result["datetime"] >= date_from]
+            mask &= df["datetime"] >= date_from
         if date_to:
             # Include entire end date by adding 23:59:59
             end_of_day = date_to + pd.Timedelta(hours=23, minutes=59, seconds=59)
-            result = result[result["datetime"] <= end_of_day]
+            mask &= df["datetime"] <= end_of_day
         
-        return result
+        return mask
     
     @staticmethod
     def filter_by_status(df: pd.DataFrame, status: str) -> pd.DataFrame:
         """Filter events by status (Completed, Upcoming, Today, Scheduled)"""
         if df.empty or "status" not in df.columns:
             return pd.DataFrame()
-        return df[df["status"] == status].copy()
+        return df[df["status"].eq(status)]
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_sport_name(sport_code: str) -> str:
         """Get full sport name from code"""
         if not sport_code or sport_code.lower() in ['unk', 'unknown', 'n/a']:
             return "Unknown Sport"
         return OlympicsDataProcessor.SPORT_NAMES.get(sport_code, sport_code.upper())
     
+    @staticmethod
+    def map_sport_names(sport_codes: pd.Series) -> pd.Series:
+        """Map a Series of sport codes to full sport names (one lookup per unique code)"""
+        if isinstance(sport_codes.dtype, pd.CategoricalDtype):
+            # Name each category once and gather by category code (-1 picks the trailing fallback)
+            names = [OlympicsDataProcessor.get_sport_name(code) for code in sport_codes.cat.categories]
+            lookup = pd.Series(names + ["Unknown Sport"], dtype=object).to_numpy()
+            return pd.Series(lookup[sport_codes.cat.codes.to_numpy()], index=sport_codes.index)
+
+        name_map = {
+            code: OlympicsDataProcessor.get_sport_name(code)
+            for code in sport_codes.dropna().unique()
+        }
+        return sport_codes.astype(object).map(name_map).fillna("Unknown Sport")
+    
+    @staticmethod
+    def map_event_emojis(sport_codes: pd.Series) -> pd.Series:
+        """Map a Series of sport codes to emojis with a single dict lookup pass"""
+        return sport_codes.astype(object).map(OlympicsDataProcessor.EMOJI_MAP).fillna("🏅")
+    
+    @staticmethod
+    def format_datetimes(times: pd.Series, fmt: str) -> pd.Series:
+        """Format datetimes with strftime once per distinct value (missing values become "")"""
+        codes, uniques = pd.factorize(times)
+        # Code -1 (NaT) picks the trailing empty string
+        lookup = pd.Series(list(uniques.strftime(fmt)) + [""], dtype=object).to_numpy()
+        return pd.Series(lookup[codes], index=times.index)
+    
     @staticmethod
     def categorize_discipline(discipline: str) -> str:
         """Categorize discipline into broader type"""
@@ -360,36 +560,12 @@ class OlympicsDataProcessor:
     @staticmethod
     def get_event_emoji(sport_code: str) -> str:
         """Get emoji for sport code"""
-        emoji_map = {
-            "alp": "⛷️",
-            "iho": "🏒",
-            "fsk": "🎭",
-            "ssk": "⛸️",
-            "stk": "⛸️",
-            "cur": "🥌",
-            "bth": "🎯",
-            "ccs": "🏂",
-            "sjp": "🛷",
-            "ncb": "⛷️",
-            "frs": "🏂",
-            "sbd": "🏂",
-            "bob": "🛷",
-            "skn": "🛷",
-            "lug": "🛷",
-            "smt": "⛰️"
-        }
-        return emoji_map.get(sport_code, "🏅")
+        return OlympicsDataProcessor.EMOJI_MAP.get(sport_code, "🏅")
     
     @staticmethod
     def get_status_emoji(status: str) -> str:
         """Get emoji for event status"""
-        emoji_map = {
-            "Completed": "✅",
-            "Today": "🟡",
-            "Upcoming": "🔴",
-            "Scheduled": "⚪"
-        }
-        return emoji_map.get(status, "⚪")
+        return OlympicsDataProcessor.STATUS_EMOJI.get(status, "⚪")
     
     @staticmethod
     def format_event_for_display(event: pd.Series) -> Dict[str, str]:
@@ -421,13 +597,9 @@ class OlympicsDataProcessor:
         if df.empty or "sport_code" not in df.columns:
             return pd.DataFrame()
         
-        counts = df.groupby("sport_code").size().reset_index(name="count")
-        counts["sport_name"] = counts["sport_code"].apply(
-            OlympicsDataProcessor.get_sport_name
-        )
-        counts["emoji"] = counts["sport_code"].apply(
-            OlympicsDataProcessor.get_event_emoji
-        )
+        counts = df.groupby("sport_code", observed=True).size().reset_index(name="count")
+        counts["sport_name"] = OlympicsDataProcessor.map_sport_names(counts["sport_code"])
+        counts["emoji"] = OlympicsDataProcessor.map_event_emojis(counts["sport_code"])
         
         return counts.sort_values("count", ascending=False)
     
@@ -445,7 +617,7 @@ class OlympicsDataProcessor:
             return pd.DataFrame()
         
         # Remove duplicate columns if they exist
-        df_clean = df.loc[:, ~df.columns.duplicated()]
+        df_clean = df.loc[:, ~df.columns.duplicated()] if df.columns.has_duplicates else df
         
         # Create venue counts
         if city_col and city_col in df_clean.columns:
@@ -475,9 +647,7 @@ class OlympicsDataProcessor:
             return pd.DataFrame()
         
         timeline_df = df[["datetime", "event_name", "sport_code", "status"]].copy()
-        timeline_df["emoji"] = timeline_df["sport_code"].apply(
-            OlympicsDataProcessor.get_event_emoji
-        )
+        timeline_df["emoji"] = OlympicsDataProcessor.map_event_emojis(timeline_df["sport_code"])
         timeline_df = timeline_df.sort_values("datetime")
         
         return timeline_df
@@ -7,9 +7,8 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 from datetime import datetime
-import pytz
 from typing import Dict, List, Optional
-from src.data_processor import OlympicsDataProcessor
+from src.data_processor import MILAN_TZ, OlympicsDataProcessor
 
 
 class OlympicsVisualizations:
@@ -62,7 +61,8 @@ class OlympicsVisualizations:
         # Sort by datetime ascending (earliest events first) and limit to max events
         df_sorted = df.sort_values("datetime", ascending=True) if "datetime" in df.columns else df
         display_df = df_sorted.head(max_events).copy()
-        display_df = display_df.loc[:, ~display_df.columns.duplicated()]
+        if display_df.columns.has_duplicates:
+            display_df = display_df.loc[:, ~display_df.columns.duplicated()]
         
         # Create color mapping
         status_colors = {
@@ -71,16 +71,16 @@ class OlympicsVisualizations:
             "Upcoming": OlympicsVisualizations.COLORS["upcoming"],
             "Scheduled": OlympicsVisualizations.COLORS["scheduled"]
         }
-        display_df["color"] = display_df["status"].map(status_colors).fillna(OlympicsVisualizations.COLORS["scheduled"])
+        display_df["color"] = display_df["status"].astype(object).map(status_colors).fillna(OlympicsVisualizations.COLORS["scheduled"])
         
         # Create hover text safely - avoid string concatenation with Series that have duplicate indices
         event_names = display_df["event_name"].fillna("N/A").astype(str) if "event_name" in display_df.columns else pd.Series(["N/A"] * len(display_df), index=display_df.index)
         sport_codes = display_df["sport_code"] if "sport_code" in display_df.columns else pd.Series(["N/A"] * len(display_df), index=display_df.index)
-        sport_names = sport_codes.apply(OlympicsDataProcessor.get_sport_name).astype(str)
+        sport_names = OlympicsDataProcessor.map_sport_names(sport_codes).astype(str)
         # Use venue_full if available
         venue_col = "venue_full" if "venue_full" in display_df.columns else "venue"
-        venues = display_df[venue_col].fillna("N/A").astype(str) if venue_col in display_df.columns else pd.Series(["N/A"] * len(display_df), index=display_df.index)
-        cities = display_df["city"].fillna("N/A").astype(str) if "city" in display_df.columns else pd.Series(["N/A"] * len(display_df), index=display_df.index)
+        venues = display_df[venue_col].astype(object).fillna("N/A").astype(str) if venue_col in display_df.columns else pd.Series(["N/A"] * len(display_df), index=display_df.index)
+        cities = display_df["city"].astype(object).fillna("N/A").astype(str) if "city" in display_df.columns else pd.Series(["N/A"] * len(display_df), index=display_df.index)
         
         # Build hover text using list comprehension to avoid pandas alignment issues
         display_df["hover_text"] = [
@@ -207,7 +207,8 @@ class OlympicsVisualizations:
         if df.empty:
             return OlympicsVisualizations._create_empty_chart("No status data")
         
-        status_counts = df["status"].value_counts().reset_index()
+        status_counts = df["status"].value_counts()
+        status_counts = status_counts[status_counts > 0].reset_index()
         status_counts.columns = ["status", "count"]
         
         # Define status order
@@ -349,40 +350,21 @@ class OlympicsVisualizations:
             }
         
         total = len(df)
-        upcoming = len(df[df["status"].isin(["Upcoming", "Today", "Scheduled"]) if "status" in df.columns else []])
+        upcoming = int(df["status"].isin(["Upcoming", "Today", "Scheduled"]).sum()) if "status" in df.columns else 0
         
         # Count unique sports from sport_code column
         sports = 0
         if "sport_code" in df.columns:
             sports = df["sport_code"].dropna().nunique()
         
-        # Count unique countries from teams column
-        countries_set = set()
-        if "teams" in df.columns:
-            for teams in df["teams"]:
-                # Skip None, NaN, or empty values
-                if teams is None or (isinstance(teams, float) and pd.isna(teams)):
-                    continue
-                if not teams:
-                    continue
-                # Handle list of teams
-                if isinstance(teams, list):
-                    for team in teams:
-                        if isinstance(team, dict):
-                            code = team.get("code") or team.get("country_code")
-                            if code:
-                                countries_set.add(code.upper())
-                # Handle single team dict
-                elif isinstance(teams, dict):
-                    code = teams.get("code") or teams.get("country_code")
-                    if code:
-                        countries_set.add(code.upper())
+        # Count unique countries from teams column (lists or single team dicts)
+        countries = len(OlympicsDataProcessor.get_team_country_counts(df, include_single_teams=True))
         
         return {
             "total_events": str(total),
             "upcoming_events": str(upcoming),
             "sports_count": str(sports),
-            "countries_count": str(len(countries_set))
+            "countries_count": str(countries)
         }
     
     @staticmethod
@@ -405,9 +387,7 @@ class OlympicsVisualizations:
         elif "sport_code" in df.columns:
             # Fallback to sport_code
             df_temp = df.copy()
-            df_temp["discipline_detailed"] = df_temp["sport_code"].apply(
-                lambda x: OlympicsDataProcessor.get_sport_name(x)
-            )
+            df_temp["discipline_detailed"] = OlympicsDataProcessor.map_sport_names(df_temp["sport_code"])
             category_col = "discipline_detailed"
         else:
             return OlympicsVisualizations._create_empty_chart("No data available")
@@ -526,8 +506,7 @@ class OlympicsVisualizations:
             return OlympicsVisualizations._create_empty_chart("No datetime data")
         
         # Get current time in CET timezone
-        cet_tz = pytz.timezone("Europe/Rome")
-        now = datetime.now(cet_tz)
+        now = datetime.now(MILAN_TZ)
         
         # Count past and future events
         past_events = (df["datetime"] < now).sum()